@@ -1,35 +1,66 @@
-from flask import current_app, render_template, request, jsonify, url_for
+from flask import (
+    current_app,
+    render_template,
+    request,
+    jsonify,
+    url_for,
+    Response,
+    stream_with_context,
+)
 from six import string_types
 from flask import Blueprint
 from rqmonitor.utils import (
     list_all_queues_names,
     list_all_possible_job_status,
     list_all_queues,
+    invalidate_queues_cache,
+    bulk_worker_snapshot,
     reformat_job_data,
     delete_workers,
     create_redis_connection,
+    create_redis_connection_pool,
+    set_current_connection,
+    set_current_text_connection,
+    get_current_text_connection,
     delete_queue,
     empty_queue,
+    delete_queues,
+    empty_queues,
     delete_job,
+    fetch_job_exc_info,
     cancel_job,
     requeue_job,
     get_redis_memory_used,
-    job_count_in_queue_registry,
+    get_worker_info,
+    job_counts_pipelined,
     resolve_jobs,
     delete_all_jobs_in_queues_registries,
     requeue_all_jobs_in_failed_registry,
     cancel_all_queued_jobs,
 )
 
-from rqmonitor.defaults import RQ_MONITOR_REFRESH_INTERVAL
+from rqmonitor.defaults import (
+    RQ_MONITOR_REFRESH_INTERVAL,
+    RQ_MONITOR_SSE_HEARTBEAT_INTERVAL,
+)
 from rq.connections import pop_connection, push_connection, get_current_connection
 from rqmonitor.decorators import cache_control_no_store, catch_global_exception
 from rqmonitor.exceptions import RQMonitorException
 from rq.worker import Worker
+from rq.defaults import (
+    DEFAULT_WORKER_TTL,
+    DEFAULT_RESULT_TTL,
+    DEFAULT_JOB_MONITORING_INTERVAL,
+)
 from rq.suspension import suspend, resume, is_suspended
 from collections import namedtuple
+from datetime import datetime
+import json
 import logging
 import socket
+import time
+
+import orjson
 
 
 logger = logging.getLogger(__name__)
@@ -44,6 +75,16 @@ monitor_blueprint = Blueprint(
 )
 
 
+def json_response(payload):
+    """
+    orjson serializes the large data arrays of the list endpoints in C,
+    bypassing Flask's pure Python JSON encoder
+    """
+    return current_app.response_class(
+        orjson.dumps(payload), mimetype="application/json"
+    )
+
+
 @monitor_blueprint.errorhandler(RQMonitorException)
 def handle_invalid_usage(error):
     response = jsonify(error.to_dict())
@@ -56,13 +97,36 @@ def setup_redis_connection():
     redis_url = current_app.config.get("RQ_MONITOR_REDIS_URL")
     if isinstance(redis_url, string_types):
         # update as tuple
-        current_app.config["RQ_MONITOR_REDIS_URL"] = (redis_url,)
-        current_app.redis_connection = create_redis_connection((redis_url,)[0])
-    elif isinstance(redis_url, (tuple, list)):
-        current_app.redis_connection = create_redis_connection(redis_url[0])
-    else:
+        redis_url = (redis_url,)
+        current_app.config["RQ_MONITOR_REDIS_URL"] = redis_url
+    if not isinstance(redis_url, (tuple, list)):
         raise RuntimeError("No Redis configuration!")
 
+    # one shared pool per configured redis instance, so per-request
+    # connections are borrowed instead of opened from scratch, and one
+    # prebuilt client per instance indexed like the configured URLs
+    current_app.redis_connection_pools = {
+        url: create_redis_connection_pool(url) for url in redis_url
+    }
+    current_app.redis_clients = tuple(
+        create_redis_connection(connection_pool=current_app.redis_connection_pools[url])
+        for url in redis_url
+    )
+    current_app.redis_connection = current_app.redis_clients[0]
+
+    # parallel clients that decode replies to str in the parser; these
+    # are never shared with rq because its job payloads are binary, but
+    # the monitor's own worker reads are pure text and skip the
+    # per-field bytes.decode churn this way
+    text_pools = {
+        url: create_redis_connection_pool(url, decode_responses=True)
+        for url in redis_url
+    }
+    current_app.redis_text_clients = tuple(
+        create_redis_connection(connection_pool=text_pools[url]) for url in redis_url
+    )
+    current_app.redis_text_connection = current_app.redis_text_clients[0]
+
 
 @monitor_blueprint.before_request
 def push_rq_connection():
@@ -77,20 +141,30 @@ def push_rq_connection():
 
     # print(new_instance_index, type(new_instance_index))
     if new_instance_index is not None:
-        redis_url = current_app.config.get("RQ_MONITOR_REDIS_URL")
         new_instance_index = int(new_instance_index)
-        if int(new_instance_index) < len(redis_url):
-            new_instance = create_redis_connection(redis_url[new_instance_index])
+        if new_instance_index < len(current_app.redis_clients):
+            new_instance = current_app.redis_clients[new_instance_index]
+            new_text_instance = current_app.redis_text_clients[new_instance_index]
         else:
             raise RQMonitorException("Invalid redis instance index!", status_code=400)
     else:
         new_instance = current_app.redis_connection
+        new_text_instance = current_app.redis_text_connection
     push_connection(new_instance)
+    # let utils helpers grab this request's connections without walking
+    # rq's connection stack on every redis touch; the contextvars keep
+    # both clients request scoped so concurrent requests on different
+    # redis instances cannot read each other's connection
+    set_current_connection(new_instance)
+    set_current_text_connection(new_text_instance)
     current_app.redis_connection = new_instance
+    current_app.redis_text_connection = new_text_instance
 
 
 @monitor_blueprint.teardown_request
 def pop_rq_connection(exception=None):
+    set_current_connection(None)
+    set_current_text_connection(None)
     pop_connection()
 
 
@@ -103,7 +177,9 @@ def home(redis_instance_index):
     site_map = {}
     for rule in current_app.url_map.iter_rules():
         if rule.endpoint.startswith("rqmonitor"):
-            if rule.endpoint != "rqmonitor.static":
+            # parameterised endpoints (like the event stream) cannot be
+            # built without arguments and are not used by the frontend map
+            if rule.endpoint != "rqmonitor.static" and not rule.arguments:
                 site_map[rule.endpoint] = url_for(rule.endpoint)
 
     return render_template(
@@ -140,17 +216,18 @@ def get_queues_dashboard():
     return render_template("rqmonitor/queues.html")
 
 
-@monitor_blueprint.route("/queues", methods=["GET"])
-@catch_global_exception
-@cache_control_no_store
-def list_queues_api():
+def build_queues_payload():
     queue_list = list_all_queues()
-    rq_queues = []
+    pipe = get_current_connection().pipeline(transaction=False)
     for queue in queue_list:
+        pipe.llen(queue.key)
+
+    rq_queues = []
+    for queue, job_count in zip(queue_list, pipe.execute()):
         rq_queues.append(
             {
                 "queue_name": queue.name,
-                "job_count": queue.count,
+                "job_count": job_count,
             }
         )
     return {
@@ -158,16 +235,13 @@ def list_queues_api():
     }
 
 
-@monitor_blueprint.route("/workers", methods=["GET"])
-@catch_global_exception
-@cache_control_no_store
-def list_workers_api():
-    workers_list = Worker.all()
+def build_workers_payload():
+    workers_suspended = is_suspended(get_current_connection())
     rq_workers = []
-    for worker in workers_list:
+    for worker in bulk_worker_snapshot(get_current_text_connection()):
         host_ip_using_name = "Unresolved"
         try:
-            host_ip_using_name = socket.gethostbyname(worker.hostname)
+            host_ip_using_name = socket.gethostbyname(worker["hostname"])
         except socket.gaierror as addr_error:
             pass
         except TypeError as e:
@@ -175,14 +249,12 @@ def list_workers_api():
 
         rq_workers.append(
             {
-                "worker_name": worker.name,
-                "listening_on": ", ".join(queue.name for queue in worker.queues),
-                "status": worker.get_state()
-                if not is_suspended(get_current_connection())
-                else "suspended",
+                "worker_name": worker["name"],
+                "listening_on": ", ".join(worker["queues"]),
+                "status": worker["state"] if not workers_suspended else "suspended",
                 "host_ip": host_ip_using_name,
-                "current_job_id": worker.get_current_job_id(),
-                "failed_jobs": worker.failed_job_count,
+                "current_job_id": worker["current_job_id"],
+                "failed_jobs": worker["failed_job_count"],
             }
         )
     return {
@@ -190,6 +262,61 @@ def list_workers_api():
     }
 
 
+@monitor_blueprint.route("/queues", methods=["GET"])
+@catch_global_exception
+@cache_control_no_store
+def list_queues_api():
+    return json_response(build_queues_payload())
+
+
+@monitor_blueprint.route("/workers", methods=["GET"])
+@catch_global_exception
+@cache_control_no_store
+def list_workers_api():
+    return json_response(build_workers_payload())
+
+
+@monitor_blueprint.route("/events/<dashboard>", methods=["GET"])
+@catch_global_exception
+def stream_dashboard_events(dashboard):
+    """
+    Server-Sent Events stream pushing dashboard payloads only when they
+    change, so clients subscribed here don't need to poll the list APIs
+    on a timer; a comment heartbeat keeps idle connections alive
+    """
+    payload_builders = {
+        "queues": build_queues_payload,
+        "workers": build_workers_payload,
+    }
+    payload_builder = payload_builders.get(dashboard)
+    if payload_builder is None:
+        raise RQMonitorException(
+            "Unknown dashboard {0}".format(dashboard), status_code=400
+        )
+
+    poll_interval = (
+        current_app.config.get("RQ_MONITOR_REFRESH_INTERVAL", RQ_MONITOR_REFRESH_INTERVAL)
+        / 1000.0
+    )
+
+    @stream_with_context
+    def generate():
+        last_payload = None
+        heartbeat_after = time.monotonic() + RQ_MONITOR_SSE_HEARTBEAT_INTERVAL
+        while True:
+            payload = payload_builder()
+            if payload != last_payload:
+                yield "data: {0}\n\n".format(json.dumps(payload))
+                last_payload = payload
+                heartbeat_after = time.monotonic() + RQ_MONITOR_SSE_HEARTBEAT_INTERVAL
+            elif time.monotonic() >= heartbeat_after:
+                yield ": heartbeat\n\n"
+                heartbeat_after = time.monotonic() + RQ_MONITOR_SSE_HEARTBEAT_INTERVAL
+            time.sleep(poll_interval)
+
+    return Response(generate(), mimetype="text/event-stream")
+
+
 @monitor_blueprint.route("queues/sidebar", methods=["GET"])
 @catch_global_exception
 @cache_control_no_store
@@ -219,54 +346,68 @@ def list_jobs_api():
     requested_job_status = request.args.getlist("jobstatus[]")
 
     if not requested_queues or not requested_job_status:
-        return {
-            "draw": draw,
-            "recordsTotal": 0,
-            "recordsFiltered": 0,
-            "data": serialised_jobs,
-        }
+        return json_response(
+            {
+                "draw": draw,
+                "recordsTotal": 0,
+                "recordsFiltered": 0,
+                "data": serialised_jobs,
+            }
+        )
 
     job_blocks = []
     total_job_count = 0
 
     blocks = namedtuple("blocks", "queue registry count")
 
-    for queue in requested_queues:
-        for job_status in requested_job_status:
-            queue_registry_count = job_count_in_queue_registry(queue, job_status)
-            job_blocks.append(blocks(queue, job_status, queue_registry_count))
-            total_job_count += queue_registry_count
+    queue_status_pairs = [
+        (queue, job_status)
+        for queue in requested_queues
+        for job_status in requested_job_status
+    ]
+
+    for (queue, job_status), queue_registry_count in zip(
+        queue_status_pairs, job_counts_pipelined(queue_status_pairs)
+    ):
+        job_blocks.append(blocks(queue, job_status, queue_registry_count))
+        total_job_count += queue_registry_count
 
     jobs = resolve_jobs(job_blocks, start, length, search_query)
 
+    # read the clock once for the whole page instead of per row
+    now_ts = datetime.now().timestamp()
     for job in jobs:
-        serialised_jobs.append(reformat_job_data(job))
+        serialised_jobs.append(reformat_job_data(job, now_ts=now_ts))
 
-    return {
-        "draw": draw,
-        "recordsTotal": total_job_count,
-        "recordsFiltered": len(jobs),
-        "data": serialised_jobs,
-    }
+    return json_response(
+        {
+            "draw": draw,
+            "recordsTotal": total_job_count,
+            "recordsFiltered": len(jobs) if search_query else total_job_count,
+            "data": serialised_jobs,
+        }
+    )
 
 
 @monitor_blueprint.route("/workers/delete", methods=["POST"])
 @cache_control_no_store
 def delete_workers_api():
-    worker_names = []
     if request.method == "POST":
         worker_id = request.form.get("worker_id", None)
-        delete_all = request.form.get("delete_all")
-        if worker_id is None and (delete_all == "false" or delete_all is None):
+        delete_all = request.form.get("delete_all") == "true"
+        if worker_id is None and not delete_all:
             raise RQMonitorException("Worker ID not received", status_code=400)
 
-        if delete_all == "true":
-            for worker_instance in Worker.all():
-                worker_names.append(worker_instance.name)
-            delete_workers(worker_names)
+        if delete_all:
+            # worker names are the registry set members minus the key
+            # prefix, no need for Worker.all()'s per-worker hydration
+            worker_names = [
+                worker_key[len(Worker.redis_worker_namespace_prefix):]
+                for worker_key in Worker.all_keys()
+            ]
         else:
-            worker_names.append(worker_id)
-            delete_workers([worker_id])
+            worker_names = [worker_id]
+        delete_workers(worker_names)
 
         return {
             "message": "Successfully deleted worker/s {0}".format(
@@ -322,11 +463,14 @@ def empty_queue_api():
 @cache_control_no_store
 def delete_all_queues_api():
     if request.method == "POST":
-        queue_names = [queue.name for queue in list_all_queues()]
-        for queue in list_all_queues():
-            queue.delete(delete_jobs=True)
+        # act on a fresh queue list, not the short lived cache
+        invalidate_queues_cache()
+        queue_list = list_all_queues()
+        delete_queues(queue_list)
         return {
-            "message": "Successfully deleted queues {0}".format(", ".join(queue_names))
+            "message": "Successfully deleted queues {0}".format(
+                ", ".join(queue.name for queue in queue_list)
+            )
         }
 
 
@@ -335,14 +479,24 @@ def delete_all_queues_api():
 @cache_control_no_store
 def empty_all_queues_api():
     if request.method == "POST":
-        queue_names = [queue.name for queue in list_all_queues()]
-        for queue in list_all_queues():
-            queue.empty()
+        # act on a fresh queue list, not the short lived cache
+        invalidate_queues_cache()
+        queue_list = list_all_queues()
+        empty_queues(queue_list)
         return {
-            "message": "Successfully emptied queues {0}".format(", ".join(queue_names))
+            "message": "Successfully emptied queues {0}".format(
+                ", ".join(queue.name for queue in queue_list)
+            )
         }
 
 
+WORKER_INFO_DATE_FORMAT = "%d-%m-%Y %H:%M:%S"
+
+
+def format_worker_date(date, default):
+    return date.strftime(WORKER_INFO_DATE_FORMAT) if date is not None else default
+
+
 @monitor_blueprint.route("/workers/info", methods=["GET"])
 @catch_global_exception
 @cache_control_no_store
@@ -353,40 +507,32 @@ def worker_info_api():
         if worker_id is None:
             raise RQMonitorException("Worker ID not received !", status_code=400)
 
-        worker_instance = Worker.find_by_key(
-            Worker.redis_worker_namespace_prefix + worker_id
+        worker_instance = get_worker_info(
+            worker_id, connection=get_current_text_connection()
         )
         return {
-            "worker_host_name": worker_instance.hostname
-            if worker_instance.hostname is not None
+            "worker_host_name": worker_instance["hostname"]
+            if worker_instance["hostname"] is not None
             else "None",
-            "worker_ttl": worker_instance.default_worker_ttl,
-            "worker_result_ttl": worker_instance.default_result_ttl,
-            "worker_name": worker_instance.name,
-            "worker_birth_date": worker_instance.birth_date.strftime(
-                "%d-%m-%Y %H:%M:%S"
-            )
-            if worker_instance.birth_date is not None
-            else "Not Available",
-            "worker_death_date": worker_instance.death_date.strftime(
-                "%d-%m-%Y %H:%M:%S"
-            )
-            if worker_instance.death_date is not None
-            else "Is Alive",
-            "worker_last_cleaned_at": worker_instance.last_cleaned_at.strftime(
-                "%d-%m-%Y %H:%M:%S"
-            )
-            if worker_instance.last_cleaned_at is not None
-            else "Not Yet Cleaned",
-            "worker_failed_job_count": worker_instance.failed_job_count,
-            "worker_successful_job_count": worker_instance.successful_job_count,
-            "worker_job_monitoring_interval": worker_instance.job_monitoring_interval,
-            "worker_last_heartbeat": worker_instance.last_heartbeat.strftime(
-                "%d-%m-%Y %H:%M:%S"
-            )
-            if worker_instance.last_heartbeat is not None
-            else "Not Available",
-            "worker_current_job_id": worker_instance.get_current_job_id(),
+            "worker_ttl": DEFAULT_WORKER_TTL,
+            "worker_result_ttl": DEFAULT_RESULT_TTL,
+            "worker_name": worker_instance["name"],
+            "worker_birth_date": format_worker_date(
+                worker_instance["birth_date"], "Not Available"
+            ),
+            "worker_death_date": format_worker_date(
+                worker_instance["death_date"], "Is Alive"
+            ),
+            # rq only tracks last_cleaned_at on the live worker process,
+            # it is never persisted in the worker hash
+            "worker_last_cleaned_at": "Not Yet Cleaned",
+            "worker_failed_job_count": worker_instance["failed_job_count"],
+            "worker_successful_job_count": worker_instance["successful_job_count"],
+            "worker_job_monitoring_interval": DEFAULT_JOB_MONITORING_INTERVAL,
+            "worker_last_heartbeat": format_worker_date(
+                worker_instance["last_heartbeat"], "Not Available"
+            ),
+            "worker_current_job_id": worker_instance["current_job_id"],
         }
 
 
@@ -431,6 +577,19 @@ def delete_job_api():
         return {"message": "Successfully deleted job with ID {0}".format(job_id)}
 
 
+@monitor_blueprint.route("/jobs/exc_info", methods=["GET"])
+@catch_global_exception
+@cache_control_no_store
+def job_exc_info_api():
+    if request.method == "GET":
+        job_id = request.args.get("job_id", None)
+
+        if job_id is None:
+            raise RQMonitorException("Job ID not received", status_code=400)
+
+        return {"job_id": job_id, "job_exc_info": fetch_job_exc_info(job_id)}
+
+
 @monitor_blueprint.route("/jobs/delete/all", methods=["POST"])
 @catch_global_exception
 @cache_control_no_store
@@ -0,0 +1,6 @@
+from flask_caching import Cache
+
+# Process local cache shared by the blueprint and utils, initialised on
+# the app inside create_app_with_blueprint. Used to throttle cheap but
+# frequently polled lookups such as queue names and redis memory usage.
+cache = Cache(config={"CACHE_TYPE": "simple"})
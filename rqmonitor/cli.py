@@ -17,6 +17,7 @@ from urllib.parse import urlparse, parse_qs, unquote
 import click
 from flask import Flask, Response, request
 
+from rqmonitor.cache import cache
 from rqmonitor.defaults import RQ_MONITOR_REDIS_URL, RQ_MONITOR_REFRESH_INTERVAL
 from rqmonitor.version import VERSION
 from rqmonitor.bp import monitor_blueprint
@@ -65,6 +66,7 @@ def create_app_with_blueprint(
     if username:
         add_basic_auth(blueprint, username, password)
 
+    cache.init_app(app)
     app.register_blueprint(blueprint, url_prefix=url_prefix)
 
     return app
@@ -279,7 +281,9 @@ def run(
     for url in redis_url:
         check_url(url)
 
-    app.run(host=bind, port=port, debug=debug)
+    # the dashboard endpoints are redis I/O bound, handle requests in
+    # threads so concurrent polls overlap instead of queueing up
+    app.run(host=bind, port=port, debug=debug, threaded=True)
 
 
 def main():
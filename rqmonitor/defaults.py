@@ -1,3 +1,4 @@
 RQ_MONITOR_REDIS_URL = "redis://127.0.0.1:6379"
 RQ_MONITOR_REFRESH_INTERVAL = 2000  # 2 secs
 RQ_MONITOR_REDIS_MEMORY_UPDATE = 10000
+RQ_MONITOR_SSE_HEARTBEAT_INTERVAL = 120  # secs, keeps idle event streams alive
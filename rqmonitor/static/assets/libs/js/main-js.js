@@ -517,7 +517,22 @@ function setup_jobs_datatable(nunjucks_urls, site_map) {
 
     });
 
-}     
+    // listings only carry a preview of each traceback, pull the full one
+    // on demand when a truncated card asks for it
+    $('#jobs_table tbody').on('click', '.job-full-traceback', function (event) {
+        event.preventDefault();
+        var traceback_link = $(this);
+        var traceback_container = traceback_link.closest('.list-group-item').find('.job-exc-info');
+        $.get({
+            url: site_map['rqmonitor.job_exc_info_api'],
+            data: { 'job_id': traceback_link.data('job-id') },
+        }).then(function (response) {
+            traceback_container.text(response.job_exc_info);
+            traceback_link.remove();
+        });
+    });
+
+}
 
 function action_modal_onconfirm(site_map) {
     $('#confirmation').on('click', '.confirm', function (event) {
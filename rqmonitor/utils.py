@@ -1,10 +1,12 @@
 import humanize
 import redis
+import contextvars
 import os
+import time
+import zlib
 import signal
 import logging
 import socket
-import zlib
 from rq.registry import (
     StartedJobRegistry,
     FinishedJobRegistry,
@@ -14,10 +16,17 @@ from rq.registry import (
 )
 from rq.exceptions import NoSuchJobError
 from rq.connections import resolve_connection
-from rq.utils import utcparse
-from rq.exceptions import InvalidJobOperationError
+from rq.compat import decode_redis_hash
+from rq.utils import as_text, utcparse
+from flask import current_app
+from rqmonitor.cache import cache
+from rqmonitor.defaults import RQ_MONITOR_REDIS_MEMORY_UPDATE
 from rqmonitor.exceptions import RQMonitorException
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate
 from rq.worker import Worker
 from rq.queue import Queue
 from rq.job import Job
@@ -32,6 +41,11 @@ logger.addHandler(stream_handler)
 logger.setLevel(logging.INFO)
 
 
+# resolved once at import, the listing hot paths concatenate these
+# constantly and the class attribute chain costs two lookups per call
+_QUEUE_PREFIX = Queue.redis_queue_namespace_prefix
+_WORKER_PREFIX = Worker.redis_worker_namespace_prefix
+
 REGISTRIES = [
     StartedJobRegistry,
     FinishedJobRegistry,
@@ -42,20 +56,180 @@ REGISTRIES = [
 
 JobStatus = ["queued", "finished", "failed", "started", "deferred", "scheduled"]
 
+# registry class or status name -> Queue attribute holding that registry,
+# one dict lookup instead of walking an elif ladder at every dispatch;
+# "queued" is handled by callers since the queue list is not a registry
+_REGISTRY_ATTR = {
+    StartedJobRegistry: "started_job_registry",
+    "started": "started_job_registry",
+    FinishedJobRegistry: "finished_job_registry",
+    "finished": "finished_job_registry",
+    FailedJobRegistry: "failed_job_registry",
+    "failed": "failed_job_registry",
+    DeferredJobRegistry: "deferred_job_registry",
+    "deferred": "deferred_job_registry",
+    ScheduledJobRegistry: "scheduled_job_registry",
+    "scheduled": "scheduled_job_registry",
+}
+
+
+# drains queue lists as well as registry sorted sets, deleting the backing
+# job hashes along the way; job namespace prefix is passed through ARGV so
+# the same script serves every queue/registry combination; unlink frees
+# the job hashes off the main thread instead of blocking like del
+REGISTRY_DRAIN_LUA = """
+    local prefix = ARGV[1]
+    local count = 0
+    for i = 1, #KEYS do
+        local key = KEYS[i]
+        local is_zset = redis.call("type", key).ok == "zset"
+        while true do
+            local job_id
+            if is_zset then
+                job_id = unpack(redis.call("zpopmin", key))
+            else
+                job_id = redis.call("lpop", key)
+            end
+            if job_id == nil or job_id == false then
+                break
+            end
+
+            -- Delete the relevant keys
+            redis.call("unlink", prefix..job_id)
+            redis.call("unlink", prefix..job_id..":dependents")
+            count = count + 1
+        end
+    end
+    return count
+"""
+
+# filters a window of a registry zset (or queue list) on the server by
+# substring-matching each job's stored description, so only matching ids
+# cross the wire; the description carries the textual call signature while
+# the data field is zlib compressed pickle a substring can never match
+REGISTRY_SEARCH_LUA = """
+    local prefix = ARGV[1]
+    local start = tonumber(ARGV[2])
+    local stop = tonumber(ARGV[3])
+    local needle = ARGV[4]
+    local ids
+    if redis.call("type", KEYS[1]).ok == "zset" then
+        ids = redis.call("zrange", KEYS[1], start, stop)
+    else
+        ids = redis.call("lrange", KEYS[1], start, stop)
+    end
+    local out = {}
+    for i = 1, #ids do
+        local description = redis.call("hget", prefix..ids[i], "description")
+        if description and string.find(description, needle, 1, true) then
+            out[#out + 1] = ids[i]
+        end
+    end
+    return out
+"""
+
+# connection for the request at hand, set by the blueprint when it pushes
+# onto rq's connection stack; saves helpers a LocalStack walk per redis
+# touch and follows the request across threads and greenlets
+_current_connection = contextvars.ContextVar("rqmonitor_connection", default=None)
+
+
+def set_current_connection(connection):
+    """Caches the request's redis connection for _get_conn, pass None on
+    teardown to fall back to rq's own connection resolution"""
+    _current_connection.set(connection)
+
+
+def _get_conn(connection=None):
+    if connection is not None:
+        return connection
+    cached = _current_connection.get()
+    if cached is not None:
+        return cached
+    return resolve_connection()
+
+
+# the decode_responses client travels the same way; an app wide attribute
+# would let concurrent requests on different redis instances read each
+# other's text client
+_current_text_connection = contextvars.ContextVar(
+    "rqmonitor_text_connection", default=None
+)
+
 
-def create_redis_connection(redis_url):
+def set_current_text_connection(connection):
+    """Caches the request's decode_responses client for
+    get_current_text_connection, pass None on teardown"""
+    _current_text_connection.set(connection)
+
+
+def get_current_text_connection():
+    return _current_text_connection.get()
+
+
+_script_cache = {}
+
+
+def _get_script(source, connection=None):
+    """
+    :param source: Lua script source
+    :param connection: connection used to register the script first time
+    :return: redis-py Script handle for given source
+
+    register_script() hashes the source client side on every call, so keep
+    one Script per source around; redis-py then issues EVALSHA and only
+    falls back to SCRIPT LOAD when the server doesn't know the digest yet
+    """
+    script = _script_cache.get(source)
+    if script is None:
+        script = _get_conn(connection).register_script(source)
+        _script_cache[source] = script
+    return script
+
+
+def create_redis_connection_pool(redis_url, decode_responses=False):
+    """
+    :param redis_url: redis URL to build the pool for
+    :param decode_responses: have redis-py decode replies to str in C
+
+    A blocking pool caps the connections per Redis instance and makes
+    request threads wait for a free connection instead of opening a new
+    TCP connection (with handshake cost) on every request
+
+    decode_responses must stay off for connections shared with rq, whose
+    job payloads are binary (zlib/pickle); it is only safe for the
+    monitor's own text-only reads
+    """
+    return redis.BlockingConnectionPool.from_url(
+        redis_url, max_connections=32, timeout=10, decode_responses=decode_responses
+    )
+
+
+def create_redis_connection(redis_url=None, connection_pool=None):
+    if connection_pool is not None:
+        return redis.Redis(connection_pool=connection_pool)
     return redis.Redis.from_url(redis_url)
 
 
+# utcparse is purely functional on its input string and worker dates
+# repeat unchanged across dashboard refreshes
+_utcparse = lru_cache(maxsize=4096)(utcparse)
+
+
+@lru_cache(maxsize=None)
+def _resolve_host_ip(hostname):
+    """DNS resolution cached for the process lifetime, worker hostnames
+    are stable enough that re-resolving per deletion is wasted latency"""
+    return socket.gethostbyname(hostname)
+
+
 def send_signal_worker(worker_id):
-    worker_instance = Worker.find_by_key(
-        Worker.redis_worker_namespace_prefix + worker_id
-    )
+    worker_instance = Worker.find_by_key(_WORKER_PREFIX + worker_id)
     worker_instance.request_stop(signum=2, frame=5)
 
 
 def attach_rq_queue_prefix(queue_id):
-    return Queue.redis_queue_namespace_prefix + queue_id
+    return _QUEUE_PREFIX + queue_id
 
 
 def delete_queue(queue_id):
@@ -63,11 +237,10 @@ def delete_queue(queue_id):
     :param queue_id: Queue ID/name to delete
     :return: None
 
-    As no specific exception is raised for below method
-    we are using general Exception class for now
+    Routed through the batched helper so key reclamation happens with
+    UNLINK rather than rq's blocking DEL
     """
-    queue_instance = Queue.from_queue_key(attach_rq_queue_prefix(queue_id))
-    queue_instance.delete()
+    delete_queues([queue_id])
 
 
 def empty_queue(queue_id):
@@ -75,11 +248,55 @@ def empty_queue(queue_id):
     :param queue_id: Queue ID/name to delete
     :return: None
 
-    As no specific exception is raised for below method
-    we are using general Exception class for now
+    Routed through the batched helper so key reclamation happens with
+    UNLINK rather than rq's blocking DEL
+    """
+    empty_queues([queue_id])
+
+
+def empty_queues(queues, connection=None):
     """
-    queue_instance = Queue.from_queue_key(attach_rq_queue_prefix(queue_id))
-    queue_instance.empty()
+    :param queues: iterable of Queue instances/names to empty
+    :return: None
+
+    Drains every given queue in a single round trip by invoking the same
+    Lua drain script rq's Queue.empty() uses against a shared pipeline,
+    instead of one script call round trip per queue
+    """
+    queues = [get_queue(queue) for queue in queues]
+    if not queues:
+        return
+
+    redis_connection = _get_conn(connection)
+    script = _get_script(REGISTRY_DRAIN_LUA, redis_connection)
+
+    pipe = redis_connection.pipeline(transaction=False)
+    for queue in queues:
+        script(keys=[queue.key], args=[Job.redis_job_namespace_prefix], client=pipe)
+    pipe.execute()
+
+
+def delete_queues(queues, connection=None):
+    """
+    :param queues: iterable of Queue instances/names to delete
+    :return: None
+
+    Drains all queues in one batch then removes the queue keys and their
+    registration in a single pipeline, instead of per-queue delete calls
+    """
+    queues = [get_queue(queue) for queue in queues]
+    if not queues:
+        return
+
+    redis_connection = _get_conn(connection)
+    empty_queues(queues, connection=redis_connection)
+
+    pipe = redis_connection.pipeline(transaction=False)
+    for queue in queues:
+        pipe.srem(Queue.redis_queues_keys, queue.key)
+        pipe.unlink(queue.key)
+    pipe.execute()
+    invalidate_queues_cache()
 
 
 def delete_workers(worker_ids, signal_to_pass=signal.SIGINT):
@@ -90,89 +307,244 @@ def delete_workers(worker_ids, signal_to_pass=signal.SIGINT):
     :param worker_id: list of worker id's to delete
     :param signal_to_pass:
     :return:
+
+    Only hostname and pid are needed to signal a worker process, so both
+    are fetched for all workers through one pipelined HMGET batch instead
+    of a full Worker.find_by_key round trip per worker; remote workers are
+    then grouped by host so each host is dealt one SSH session
     """
-    # find worker instance by key, refreshes worker implicitly
-    def attach_rq_worker_prefix(worker_id):
-        return Worker.redis_worker_namespace_prefix + worker_id
 
-    for worker_instance in [
-        Worker.find_by_key(attach_rq_worker_prefix(worker_id))
-        for worker_id in worker_ids
-    ]:
-        requested_hostname = worker_instance.hostname
+    redis_connection = _get_conn()
+    pipe = redis_connection.pipeline(transaction=False)
+    for worker_id in worker_ids:
+        pipe.hmget(_WORKER_PREFIX + worker_id, "hostname", "pid")
+    worker_metadata = pipe.execute()
+
+    local_host = socket.gethostname()
+    remote_pids_by_hostname = {}
+    for worker_id, (hostname, pid) in zip(worker_ids, worker_metadata):
+        requested_hostname = as_text(hostname) if hostname is not None else None
 
         if requested_hostname is None:
             logger.info("Worker hostname not available, skipping deletion...")
             continue
 
+        worker_pid = int(as_text(pid))
+
         # kill if on same instance
-        if socket.gethostname() == requested_hostname:
-            os.kill(worker_instance.pid, signal_to_pass)
+        if local_host == requested_hostname:
+            os.kill(worker_pid, signal_to_pass)
         else:
-            required_host_ip = socket.gethostbyname(requested_hostname)
-            fabric_config_wrapper = Config()
-            # loads from user level ssh config (~/.ssh/config) and system level
-            # config /etc/ssh/ssh_config
-            fabric_config_wrapper.load_ssh_config()
-            # to use its ssh_config parser abilities
-            paramiko_ssh_config = fabric_config_wrapper.base_ssh_config
-            for hostname in paramiko_ssh_config.get_hostnames():
-                ssh_info = paramiko_ssh_config.lookup(hostname)
-                available_host_ip = ssh_info.get("hostname")
-                if available_host_ip == required_host_ip:
-                    process_owner = None
-                    # make connection via fabric and send SIGINT for now
-                    ssh_connection = Connection(hostname)
-                    try:
-                        # find owner of process https://unix.stackexchange.com/questions/284934/return-owner-of-process-given-pid
-                        process_owner = ssh_connection.run(
-                            "ps -o user= -p {0}".format(worker_instance.pid)
-                        )
-                        # have permission to kill so this works without sudo
-                        # need to plan for other cases
-                        process_owner = process_owner.stdout.strip(" \n\t")
-                        result_kill = ssh_connection.run(
-                            "kill -{0} {1}".format(2, worker_instance.pid), hide=True
-                        )
-                        if result_kill.failed:
-                            raise RQMonitorException(
-                                "Some issue occured on running command {0.command!r} "
-                                "on {0.connection.host}, we got stdout:\n{0.stdout}"
-                                "and stderr:\n{0.stderr}".format(result_kill)
-                            )
-                    except UnexpectedExit as e:
-                        stdout, stderr = e.streams_for_display()
-                        # plan to accept password from user and proceed with sudo in future
-                        if "Operation not permitted" in stderr.strip(" \n\t"):
-                            raise RQMonitorException(
-                                "Logged in user {0} does not have permission to kill worker"
-                                " process with pid {1} on {2} because it is owned "
-                                " by user {3}".format(
-                                    ssh_info.get("user"),
-                                    worker_instance.pid,
-                                    required_host_ip,
-                                    process_owner,
-                                )
-                            )
-                        raise RQMonitorException(
-                            "Invoke's UnexpectedExit occurred with"
-                            "stdout: {0}\nstderr: {1}\nresult: {2}\nreason {3}".format(
-                                stdout.strip(" \n\t"),
-                                stderr.strip(" \n\t"),
-                                e.result,
-                                e.reason,
-                            )
-                        )
-                    return
+            remote_pids_by_hostname.setdefault(requested_hostname, []).append(
+                worker_pid
+            )
+
+    if not remote_pids_by_hostname:
+        return
+
+    fabric_config_wrapper = Config()
+    # loads from user level ssh config (~/.ssh/config) and system level
+    # config /etc/ssh/ssh_config
+    fabric_config_wrapper.load_ssh_config()
+    # to use its ssh_config parser abilities
+    paramiko_ssh_config = fabric_config_wrapper.base_ssh_config
+    # one scan of the ssh config instead of one scan per worker host
+    ip_to_ssh_host = {}
+    for hostname in paramiko_ssh_config.get_hostnames():
+        ssh_info = paramiko_ssh_config.lookup(hostname)
+        available_host_ip = ssh_info.get("hostname")
+        if available_host_ip is not None:
+            ip_to_ssh_host.setdefault(available_host_ip, (hostname, ssh_info))
+
+    host_jobs = []
+    for requested_hostname, worker_pids in remote_pids_by_hostname.items():
+        required_host_ip = _resolve_host_ip(requested_hostname)
+        matched_host = ip_to_ssh_host.get(required_host_ip)
+        if matched_host is None:
+            continue
+        host_alias, ssh_info = matched_host
+        host_jobs.append((host_alias, ssh_info, required_host_ip, worker_pids))
+
+    if not host_jobs:
+        return
+
+    # hosts are independent of each other, so signal them concurrently:
+    # total shutdown time becomes the slowest host's handshake plus kill
+    # instead of the sum over all hosts
+    errors = []
+    with ThreadPoolExecutor(max_workers=min(32, len(host_jobs))) as executor:
+        future_to_host = {
+            executor.submit(_kill_remote_workers, *host_job): host_job[0]
+            for host_job in host_jobs
+        }
+        for future in as_completed(future_to_host):
+            try:
+                future.result()
+            except RQMonitorException as e:
+                errors.append("{0}: {1}".format(future_to_host[future], e.message))
+
+    if errors:
+        raise RQMonitorException("\n".join(errors))
+
+
+def _kill_remote_workers(host_alias, ssh_info, host_ip, worker_pids):
+    """Sends SIGINT to all given worker pids on one remote host
+
+    A single SSH connection carries one combined ps plus one combined kill
+    for the whole host, instead of a fresh session and command pair per
+    worker, so the TCP and auth handshake cost is paid once per host
+    """
+    ps_pids = ",".join(str(pid) for pid in worker_pids)
+    kill_pids = " ".join(str(pid) for pid in worker_pids)
+    process_owner = None
+    # make connection via fabric and send SIGINT for now
+    with Connection(host_alias) as ssh_connection:
+        try:
+            # find owner of process https://unix.stackexchange.com/questions/284934/return-owner-of-process-given-pid
+            process_owner = ssh_connection.run("ps -o user= -p {0}".format(ps_pids))
+            # have permission to kill so this works without sudo
+            # need to plan for other cases
+            process_owner = process_owner.stdout.strip(" \n\t")
+            result_kill = ssh_connection.run(
+                "kill -{0} {1}".format(2, kill_pids), hide=True
+            )
+            if result_kill.failed:
+                raise RQMonitorException(
+                    "Some issue occured on running command {0.command!r} "
+                    "on {0.connection.host}, we got stdout:\n{0.stdout}"
+                    "and stderr:\n{0.stderr}".format(result_kill)
+                )
+        except UnexpectedExit as e:
+            stdout, stderr = e.streams_for_display()
+            # plan to accept password from user and proceed with sudo in future
+            if "Operation not permitted" in stderr.strip(" \n\t"):
+                raise RQMonitorException(
+                    "Logged in user {0} does not have permission to kill worker"
+                    " processes with pids {1} on {2} because they are owned "
+                    " by user {3}".format(
+                        ssh_info.get("user"),
+                        kill_pids,
+                        host_ip,
+                        process_owner,
+                    )
+                )
+            raise RQMonitorException(
+                "Invoke's UnexpectedExit occurred with"
+                "stdout: {0}\nstderr: {1}\nresult: {2}\nreason {3}".format(
+                    stdout.strip(" \n\t"),
+                    stderr.strip(" \n\t"),
+                    e.result,
+                    e.reason,
+                )
+            )
+
+
+def bulk_worker_snapshot(connection=None):
+    """
+    :param connection: optional redis connection to use
+    :return: list of dicts carrying name, queues, state, hostname,
+    current_job_id and failed_job_count for every registered worker
+
+    Worker.all() issues several round trips per worker (existence check,
+    refresh, current job lookup), this fetches the attributes needed by
+    the workers dashboard through a single pipelined HMGET batch
+    """
+    redis_connection = _get_conn(connection)
+    worker_keys = Worker.all_keys(connection=redis_connection)
+
+    pipe = redis_connection.pipeline(transaction=False)
+    for worker_key in worker_keys:
+        pipe.hmget(
+            worker_key, "queues", "state", "current_job", "hostname", "failed_job_count"
+        )
+
+    snapshots = []
+    for worker_key, (queues, state, current_job, hostname, failed_job_count) in zip(
+        worker_keys, pipe.execute()
+    ):
+        snapshots.append(
+            {
+                "name": worker_key[len(_WORKER_PREFIX):],
+                "queues": as_text(queues).split(",") if queues else [],
+                "state": as_text(state or "?"),
+                "current_job_id": as_text(current_job) if current_job else None,
+                "hostname": as_text(hostname),
+                "failed_job_count": int(failed_job_count) if failed_job_count else 0,
+            }
+        )
+    return snapshots
+
+
+def get_worker_info(worker_id, connection=None):
+    """
+    :param worker_id: worker id without the rq:worker: namespace prefix
+    :param connection: optional redis connection to use
+    :return: dict of worker attributes parsed from a single HGETALL
+    :raises RQMonitorException if no such worker is registered
+
+    Worker.find_by_key() costs multiple round trips (existence check plus
+    refresh) and the info endpoint re-read the current job separately;
+    one HGETALL returns every persisted field at once
+    """
+    redis_connection = _get_conn(connection)
+    raw = decode_redis_hash(
+        redis_connection.hgetall(_WORKER_PREFIX + worker_id)
+    )
+    if not raw:
+        raise RQMonitorException(
+            "Worker {0} not found".format(worker_id), status_code=404
+        )
+
+    def parse_date(field):
+        value = raw.get(field)
+        return _utcparse(as_text(value)) if value else None
+
+    def parse_count(field):
+        value = raw.get(field)
+        return int(value) if value else 0
+
+    return {
+        "name": worker_id,
+        "hostname": as_text(raw.get("hostname")),
+        "birth_date": parse_date("birth"),
+        "death_date": parse_date("death"),
+        "last_heartbeat": parse_date("last_heartbeat"),
+        "current_job_id": as_text(raw.get("current_job")),
+        "failed_job_count": parse_count("failed_job_count"),
+        "successful_job_count": parse_count("successful_job_count"),
+    }
+
+
+# Queue.all() results per connection, kept for at most _QUEUES_CACHE_TTL
+_queues_cache = {}
+_QUEUES_CACHE_TTL = 1.0  # secs
 
 
 def list_all_queues():
     """
     :return: Iterable for all available queue instances
+
+    Queue.all() costs an SMEMBERS plus instantiation work and every
+    dashboard view asks for it repeatedly, so results are kept for a
+    second per connection; deletion paths call invalidate_queues_cache()
+    so removed queues never outlive the response that deleted them
     """
-    return Queue.all()
+    redis_connection = _get_conn()
+    cached = _queues_cache.get(redis_connection)
+    if cached is not None and time.monotonic() - cached[0] < _QUEUES_CACHE_TTL:
+        return cached[1]
+
+    queues = Queue.all(connection=redis_connection)
+    _queues_cache[redis_connection] = (time.monotonic(), queues)
+    return queues
 
 
+def invalidate_queues_cache():
+    _queues_cache.clear()
+    cache.delete_memoized(list_all_queues_names)
+
+
+@cache.cached(timeout=3600, key_prefix="job_statuses")
 def list_all_possible_job_status():
     """
     :return: list of all possible job status
@@ -180,9 +552,13 @@ def list_all_possible_job_status():
     return JobStatus
 
 
+@cache.memoize(timeout=5)
 def list_all_queues_names():
     """
     :return: Iterable of all queue names
+
+    Cached for a few seconds as every dashboard page and the sidebar
+    ask for this on each refresh
     """
     return [queue.name for queue in list_all_queues()]
 
@@ -192,9 +568,9 @@ def validate_job_data(
     val,
     default="None",
     humanize_func=None,
-    with_utcparse=False,
     relative_to_now=False,
     append_s=False,
+    now_ts=None,
 ):
     if not val:
         return default
@@ -203,59 +579,64 @@ def validate_job_data(
     elif humanize_func is None:
         return val
     else:
-        if with_utcparse and relative_to_now:
-            return humanize_func(utcparse(val).timestamp() - datetime.now().timestamp())
-        elif with_utcparse and not relative_to_now:
-            return humanize_func(utcparse(val).timestamp())
+        if relative_to_now:
+            if now_ts is None:
+                now_ts = datetime.now().timestamp()
+            return humanize_func(val.timestamp() - now_ts)
         else:
             return humanize_func(val)
 
 
-def reformat_job_data(job: Job):
+def reformat_job_data(job: Job, now_ts=None):
     """
     Create serialized version of Job which can be consumed by DataTable
-    (RQ provides to_dict) including origin(queue), created_at, data, description,
-    enqueued_at, started_at, ended_at, result, exc_info, timeout, result_ttl,
-     failure_ttl, status, dependency_id, meta, ttl
+    including origin(queue), created_at, description, enqueued_at,
+    exc_info, timeout, result_ttl, failure_ttl, status, ttl
 
     :param job: Job Instance need to be serialized
     :return: serialized job
+
+    Jobs handed in here were already hydrated through Job.fetch_many's
+    pipelined HGETALL, so every field is read straight off the instance
+    instead of round-tripping through job.to_dict() which recompresses
+    the payload and reformats the timestamps only for us to undo both
+
+    now_ts lets callers serializing a whole page of jobs read the clock
+    once instead of twice per row
     """
-    serialized_job = job.to_dict()
+    if now_ts is None:
+        now_ts = datetime.now().timestamp()
     return {
         "job_info": {
             "job_id": validate_job_data(job.get_id()),
-            "job_description": validate_job_data(serialized_job.get("description")),
-            "job_exc_info": validate_job_data(
-                zlib.decompress(serialized_job.get("exc_info")).decode("utf-8")
-                if serialized_job.get("exc_info") is not None
-                else None
-            ),
-            "job_status": validate_job_data(serialized_job.get("status")),
-            "job_queue": validate_job_data(serialized_job.get("origin")),
+            "job_description": validate_job_data(job.description),
+            "job_exc_info": validate_job_data(job.exc_info),
+            # lets the job card offer the full traceback when the listing
+            # only carries a preview
+            "job_exc_info_truncated": getattr(job, "_exc_info_truncated", False),
+            "job_status": validate_job_data(job.get_status(refresh=False)),
+            "job_queue": validate_job_data(job.origin),
             "job_created_time_humanize": validate_job_data(
-                serialized_job.get("created_at"),
+                job.created_at,
                 humanize_func=humanize.naturaltime,
-                with_utcparse=True,
                 relative_to_now=True,
+                now_ts=now_ts,
             ),
             "job_enqueued_time_humanize": validate_job_data(
-                serialized_job.get("enqueued_at"),
+                job.enqueued_at,
                 humanize_func=humanize.naturaltime,
-                with_utcparse=True,
                 relative_to_now=True,
+                now_ts=now_ts,
             ),
-            "job_ttl": validate_job_data(
-                serialized_job.get("ttl"), default="Infinite", append_s=True
-            ),
+            "job_ttl": validate_job_data(job.ttl, default="Infinite", append_s=True),
             "job_timeout": validate_job_data(
-                serialized_job.get("timeout"), default="180s", append_s=True
+                job.timeout, default="180s", append_s=True
             ),
             "job_result_ttl": validate_job_data(
-                serialized_job.get("result_ttl"), default="500s", append_s=True
+                job.result_ttl, default="500s", append_s=True
             ),
             "job_fail_ttl": validate_job_data(
-                serialized_job.get("failure_ttl"), default="1yr", append_s=True
+                job.failure_ttl, default="1yr", append_s=True
             ),
             "job_name": job.func_name,
             "job_args": job.args,
@@ -272,10 +653,10 @@ def get_queue(queue):
         return queue
 
     if isinstance(queue, str):
-        if queue.startswith(Queue.redis_queue_namespace_prefix):
+        if queue.startswith(_QUEUE_PREFIX):
             return Queue.from_queue_key(queue)
         else:
-            return Queue.from_queue_key(Queue.redis_queue_namespace_prefix + queue)
+            return Queue.from_queue_key(_QUEUE_PREFIX + queue)
 
     raise TypeError("{0} is not of class {1} or {2}".format(queue, str, Queue))
 
@@ -313,23 +694,94 @@ def list_jobs_in_queue_all_registries(queue):
     return jobs
 
 
-def _apply_jobs_search(jobs, search_query):
-    return [job for job in jobs if _apply_job_search(job, search_query)]
+# bytes of traceback decompressed for each listed job, enough for the row
+# expansion preview while the full traceback stays compressed in Redis
+EXC_INFO_PREVIEW_BYTES = 256
 
 
-def _apply_job_search(job, search_query):
-    if not search_query:
-        return True
+def _exc_info_preview(compressed):
+    """Decompresses only the head of a stored traceback, most rows never
+    expand theirs and the full string can be pulled with
+    fetch_job_exc_info when one does
 
-    return search_query in str(job.args) or search_query in job.func_name
+    :return: (preview text or None, whether the tail was cut off)
+    """
+    if not compressed:
+        return None, False
+    decompressor = zlib.decompressobj()
+    preview = decompressor.decompress(compressed, EXC_INFO_PREVIEW_BYTES)
+    # a cut can land mid codepoint, replace rather than raise
+    text = preview.decode("utf-8", errors="replace")
+    truncated = bool(decompressor.unconsumed_tail)
+    if truncated:
+        text += "\n... (truncated)"
+    return text, truncated
+
+
+def fetch_job_exc_info(job_id, connection=None):
+    """
+    :param job_id: id of the job whose traceback is wanted
+    :return: full decompressed exc_info string, None when the job has none
 
+    Listings only carry a short preview of each traceback, this pulls and
+    decompresses the whole thing for a single job on demand
+    """
+    redis_connection = _get_conn(connection)
+    compressed = redis_connection.hget(
+        Job.redis_job_namespace_prefix + job_id, "exc_info"
+    )
+    if not compressed:
+        return None
+    return as_text(zlib.decompress(compressed))
+
+
+def _fetch_many_jobs_fast(job_ids, conn):
+    """
+    Job.fetch_many wraps its HGETALLs in a MULTI/EXEC pipeline and keeps a
+    None slot for every missing id; the listing path only needs the jobs
+    that exist, so issue plain pipelined HGETALLs and restore inline,
+    trimming each traceback to a preview instead of decompressing it whole
+
+    Generator so the raw replies are deserialized one at a time and a
+    caller stopping early never restores the rest
+    """
+    pipe = conn.pipeline(transaction=False)
+    for job_id in job_ids:
+        pipe.hgetall(Job.redis_job_namespace_prefix + job_id)
+    raw_jobs = pipe.execute()
 
-def _fetch_many_jobs(job_ids, conn, search):
-    return [
-        job
-        for job in Job.fetch_many(job_ids=job_ids, connection=conn)
-        if job is not None and _apply_job_search(job, search)
-    ]
+    for job_id, raw in zip(job_ids, raw_jobs):
+        if not raw:
+            continue
+        # keep Job.restore from eagerly inflating the full traceback
+        exc_info = raw.pop(b"exc_info", None)
+        job = Job(job_id, connection=conn)
+        job.restore(raw)
+        job.exc_info, job._exc_info_truncated = _exc_info_preview(exc_info)
+        yield job
+
+
+def _registry_redis_key(queue, registry):
+    """Maps a registry class or status name to its redis key on the given
+    queue instance, the queue list itself standing in for "queued" """
+    if registry == "queued":
+        return queue.key
+    attr = _REGISTRY_ATTR.get(registry)
+    if attr is None:
+        return None
+    return getattr(queue, attr).key
+
+
+def _search_jobs_in_redis(key, start, end, search_query, conn):
+    """Runs the registry search script over one registry/queue window and
+    hydrates only the matching jobs, so non-matching job payloads never
+    leave Redis"""
+    script = _get_script(REGISTRY_SEARCH_LUA, conn)
+    matched = script(
+        keys=[key],
+        args=[Job.redis_job_namespace_prefix, start, end, search_query],
+    )
+    return _fetch_many_jobs_fast([as_text(job_id) for job_id in matched], conn)
 
 
 def list_jobs_in_queue_registry(queue, registry, search_query=None, start=0, end=-1):
@@ -339,115 +791,129 @@ def list_jobs_in_queue_registry(queue, registry, search_query=None, start=0, end
     :param queue: Queue name from which jobs need to be listed
     :param registry: registry class from which jobs to be returned
     :param search_query: search string used to search by jobs arguments and jobs names
-    :return: list of all jobs matching above criteria at present scenario
+    :return: iterable of all jobs matching above criteria at present
+    scenario, lazy where possible so early-stopping callers skip the
+    deserialization of jobs they never consume
 
     By default returns all jobs in given queue and registry combination
+
+    Searches are filtered server side on the job description so only the
+    matching jobs are fetched and deserialized
     """
     queue = get_queue(queue)
-    redis_connection = resolve_connection()
-
-    result = []
-
-    if registry == StartedJobRegistry or registry == "started":
-        job_ids = queue.started_job_registry.get_job_ids(start, end)
-
-        result = _fetch_many_jobs(job_ids, redis_connection, search_query)
-    elif registry == FinishedJobRegistry or registry == "finished":
-        job_ids = queue.finished_job_registry.get_job_ids(start, end)
-
-        result = _fetch_many_jobs(job_ids, redis_connection, search_query)
-    elif registry == FailedJobRegistry or registry == "failed":
-        job_ids = queue.failed_job_registry.get_job_ids(start, end)
-
-        result = _fetch_many_jobs(job_ids, redis_connection, search_query)
-    elif registry == DeferredJobRegistry or registry == "deferred":
-        job_ids = queue.deferred_job_registry.get_job_ids(start, end)
-
-        result = _fetch_many_jobs(job_ids, redis_connection, search_query)
-    elif registry == ScheduledJobRegistry or registry == "scheduled":
-        job_ids = queue.scheduled_job_registry.get_job_ids(start, end)
+    redis_connection = _get_conn()
+
+    if search_query:
+        key = _registry_redis_key(queue, registry)
+        if key is None:
+            return []
+        return _search_jobs_in_redis(
+            key, start, end, search_query, redis_connection
+        )
 
-        result = _fetch_many_jobs(job_ids, redis_connection, search_query)
     # although not implemented as registry this is for ease
-    elif registry == "queued":
-        # get_jobs API has (offset, length) as parameter, while above function has start, end
+    if registry == "queued":
+        # get_jobs API has (offset, length) as parameter, while this function has start, end
         # so below is hack to fit this on above definition
         if end == -1:
             # -1 means all are required so pass as it is
-            result = _apply_jobs_search(queue.get_jobs(start, end), search_query)
-        else:
-            # end-start+1 gives required length
-            result = _apply_jobs_search(queue.get_jobs(start, end - start + 1), search_query)
+            return queue.get_jobs(start, end)
+        # end-start+1 gives required length
+        return queue.get_jobs(start, end - start + 1)
+
+    attr = _REGISTRY_ATTR.get(registry)
+    if attr is None:
+        return []
 
-    return result
+    job_ids = getattr(queue, attr).get_job_ids(start, end)
+    return _fetch_many_jobs_fast(job_ids, redis_connection)
 
 
-def empty_registry(registry_name, queue_name, connection=None):
+def empty_registry(registry_name, queue_name, connection=None, pipeline=None):
     """Empties a specific registry for a specific queue, Not in RQ, implemented
     here for performance reasons
+
+    When a pipeline is given the drain script call is only queued on it
+    and the caller is responsible for executing the pipeline
     """
-    redis_connection = resolve_connection(connection)
+    redis_connection = _get_conn(connection)
     queue_instance = Queue.from_queue_key(
-        Queue.redis_queue_namespace_prefix + queue_name
+        _QUEUE_PREFIX + queue_name
     )
 
-    registry_instance = None
-    if registry_name == "failed":
-        registry_instance = queue_instance.failed_job_registry
-    elif registry_name == "started":
-        registry_instance = queue_instance.started_job_registry
-    elif registry_name == "scheduled":
-        registry_instance = queue_instance.scheduled_job_registry
-    elif registry_name == "deferred":
-        registry_instance = queue_instance.deferred_job_registry
-    elif registry_name == "finished":
-        registry_instance = queue_instance.finished_job_registry
-
-    script = """
-        local prefix = "{0}"
-        local q = KEYS[1]
-        local count = 0
-        while true do
-            local job_id, score = unpack(redis.call("zpopmin", q))
-            if job_id == nil or score == nil then
-                break
-            end
+    registry_instance = getattr(queue_instance, _REGISTRY_ATTR[registry_name])
 
-            -- Delete the relevant keys
-            redis.call("del", prefix..job_id)
-            redis.call("del", prefix..job_id..":dependents")
-            count = count + 1
-        end
-        return count
-    """.format(
-        registry_instance.job_class.redis_job_namespace_prefix
-    ).encode(
-        "utf-8"
+    script = _get_script(REGISTRY_DRAIN_LUA, redis_connection)
+    return script(
+        keys=[registry_instance.key],
+        args=[registry_instance.job_class.redis_job_namespace_prefix],
+        client=pipeline if pipeline is not None else redis_connection,
     )
-    script = redis_connection.register_script(script)
-    return script(keys=[registry_instance.key])
 
 
 def delete_all_jobs_in_queues_registries(queues, registries):
+    """
+    :param queues: queues whose jobs are to be deleted
+    :param registries: status names selecting the registries to drain
+    :return: None
+
+    The selected queue list and registry keys are drained by a single
+    invocation of the drain script per queue, all queued on one pipeline,
+    so the whole bulk deletion costs a single round trip and one EVALSHA
+    per queue instead of one per (queue, registry) pair
+    """
+    redis_connection = _get_conn()
+    script = _get_script(REGISTRY_DRAIN_LUA, redis_connection)
+
+    pipe = redis_connection.pipeline(transaction=False)
     for queue in queues:
+        queue_instance = get_queue(queue)
+        keys = []
         for registry in registries:
-            if registry == "queued":
-                # removes all jobs from queue and from job namespace
-                get_queue(queue).empty()
-            else:
-                empty_registry(registry, queue)
+            key = _registry_redis_key(queue_instance, registry)
+            if key is not None:
+                keys.append(key)
+        if keys:
+            script(keys=keys, args=[Job.redis_job_namespace_prefix], client=pipe)
+    pipe.execute()
 
 
 def requeue_all_jobs_in_failed_registry(queues):
+    """
+    :param queues: queues whose failed registries are to be requeued
+    :return: count of jobs which could not be requeued
+
+    Mirrors FailedJobRegistry.requeue but batches the round trips: jobs are
+    fetched in bulk, removed from the registry on one pipeline and
+    re-enqueued on another, so requeueing N jobs costs a constant number of
+    round trips instead of several per job
+    """
+    redis_connection = _get_conn()
     fail_count = 0
     for queue in queues:
-        failed_job_registry = get_queue(queue).failed_job_registry
+        queue_instance = get_queue(queue)
+        failed_job_registry = queue_instance.failed_job_registry
         job_ids = failed_job_registry.get_job_ids()
+        if not job_ids:
+            continue
+        jobs = Job.fetch_many(job_ids, connection=redis_connection)
+
+        pipe = redis_connection.pipeline(transaction=False)
         for job_id in job_ids:
-            try:
-                failed_job_registry.requeue(job_id)
-            except InvalidJobOperationError:
+            pipe.zrem(failed_job_registry.key, job_id)
+        removed = pipe.execute()
+
+        pipe = redis_connection.pipeline(transaction=False)
+        for job, was_removed in zip(jobs, removed):
+            # job hash may have expired or a concurrent requeue may have won
+            # the zrem race, in both cases the job cannot be re-enqueued
+            if job is None or not was_removed:
                 fail_count += 1
+                continue
+            job.started_at = None
+            job.ended_at = None
+            queue_instance.enqueue_job(job, pipeline=pipe)
+        pipe.execute()
     return fail_count
 
 
@@ -455,11 +921,20 @@ def cancel_all_queued_jobs(queues):
     """
     :param queues: list of queues from which to cancel the jobs
     :return: None
+
+    Cancelling a queued job only needs its id removed from the queue list
+    and its hash dropped, so the per job fetch/cancel round trips are
+    replaced by one pipeline carrying every removal
     """
+    redis_connection = _get_conn()
+    pipe = redis_connection.pipeline(transaction=False)
     for queue in queues:
-        job_ids = get_queue(queue).get_job_ids()
-        for job_id in job_ids:
-            cancel_job(job_id)
+        queue_instance = get_queue(queue)
+        for job_id in queue_instance.get_job_ids():
+            pipe.lrem(queue_instance.key, 1, job_id)
+            pipe.unlink(Job.redis_job_namespace_prefix + job_id)
+            pipe.unlink(Job.redis_job_namespace_prefix + job_id + ":dependents")
+    pipe.execute()
 
 
 def job_count_in_queue_registry(queue, registry):
@@ -469,35 +944,88 @@ def job_count_in_queue_registry(queue, registry):
     :return: count of jobs matching above criteria
     """
     queue = get_queue(queue)
-    if registry == StartedJobRegistry or registry == "started":
-        return len(queue.started_job_registry)
-    elif registry == FinishedJobRegistry or registry == "finished":
-        return len(queue.finished_job_registry)
-    elif registry == FailedJobRegistry or registry == "failed":
-        return len(queue.failed_job_registry)
-    elif registry == DeferredJobRegistry or registry == "deferred":
-        return len(queue.deferred_job_registry)
-    elif registry == ScheduledJobRegistry or registry == "scheduled":
-        return len(queue.scheduled_job_registry)
     # although not implemented as registry this is for uniformity in API
-    elif registry == "queued":
+    if registry == "queued":
         return len(queue)
-    else:
+
+    attr = _REGISTRY_ATTR.get(registry)
+    if attr is None:
         return 0
+    return len(getattr(queue, attr))
+
+
+def job_counts_pipelined(queue_status_pairs):
+    """
+    :param queue_status_pairs: iterable of (queue, status) pairs where status
+    is one of the strings in JobStatus
+    :return: list of job counts aligned with the given pairs
+
+    Issues all count commands through a single pipeline so N queues * M
+    statuses cost one Redis round trip instead of one round trip per pair
+    """
+    redis_connection = _get_conn()
+    pipe = redis_connection.pipeline(transaction=False)
+    for queue, status in queue_status_pairs:
+        queue = get_queue(queue)
+        if status == "queued":
+            pipe.llen(queue.key)
+            continue
+        attr = _REGISTRY_ATTR.get(status)
+        if attr is None:
+            # statuses come straight from the request, reject rather than 500
+            raise RQMonitorException(
+                "{0} is not a valid job status".format(status), status_code=400
+            )
+        pipe.zcard(getattr(queue, attr).key)
+    return pipe.execute()
+
+
+def _scan_keys_batched(connection, match, count=500):
+    """Yields batches of keys matching the pattern via cursor driven SCAN,
+    so the traversal never blocks Redis the way KEYS would"""
+    cursor = 0
+    while True:
+        cursor, keys = connection.scan(cursor=cursor, match=match, count=count)
+        if keys:
+            yield keys
+        if cursor == 0:
+            break
 
 
 def get_redis_memory_used(connection=None):
     """
     All memory used in redis rq: namespace
     :param connection:
-    :return:
-    """
-    redis_connection = resolve_connection(connection)
-    script = """
-        return 0;
+    :return: human readable size of the rq namespace
+
+    SCAN walks the namespace in batches and each batch's MEMORY USAGE
+    calls go out on one pipeline, so the measurement is bounded per
+    command and never stalls Redis; results are cached per redis instance
+    for RQ_MONITOR_REDIS_MEMORY_UPDATE milliseconds so the frontend
+    polling on home and /redis/memory collapses to roughly one
+    measurement per interval without one instance's figure being served
+    for another
     """
-    script = redis_connection.register_script(script)
-    return humanize.naturalsize(script(args=[RQ_REDIS_NAMESPACE]))
+    redis_connection = _get_conn(connection)
+    cache_key = "redis_memory_used:{0!r}".format(redis_connection.connection_pool)
+    memory_used = cache.get(cache_key)
+    if memory_used is not None:
+        return memory_used
+
+    total = 0
+    for key_batch in _scan_keys_batched(redis_connection, RQ_REDIS_NAMESPACE):
+        pipe = redis_connection.pipeline(transaction=False)
+        for key in key_batch:
+            pipe.memory_usage(key)
+        total += sum(usage or 0 for usage in pipe.execute())
+    memory_used = humanize.naturalsize(total)
+
+    update_interval = current_app.config.get(
+        "RQ_MONITOR_REDIS_MEMORY_UPDATE", RQ_MONITOR_REDIS_MEMORY_UPDATE
+    )
+    # interval is in milliseconds like the other frontend refresh knobs
+    cache.set(cache_key, memory_used, timeout=update_interval / 1000)
+    return memory_used
 
 
 def fetch_job(job_id):
@@ -561,14 +1089,52 @@ def find_start_block(job_counts, start):
     """
     :return: index of block from where job picking will start from,
     cursor indicating index of starting job in selected block
+
+    Prefix sums plus a binary search instead of a Python accumulation
+    loop, both run in C
+    """
+    cumulative = list(accumulate(block.count for block in job_counts))
+    if not cumulative or start >= cumulative[-1]:
+        # marker is start index isn't available in selected jobs
+        return -1, -1
+    i = bisect_right(cumulative, start)
+    return i, start - (cumulative[i - 1] if i > 0 else 0)
+
+
+def _resolve_jobs_pipelined(blocks, cursor, length):
+    """
+    :param blocks: candidate blocks(queue, registry, job_count) starting
+    at the block containing the page
+    :param cursor: index of the first wanted job inside the first block
+    :param length: number of jobs to be returned for datatables
+
+    Issues every candidate block's range command on one pipeline and
+    hydrates the collected ids with a second pipelined HGETALL pass, so a
+    page costs two round trips however many registry blocks it spans
+    instead of a serial range plus fetch chain per block
     """
-    cumulative_count = 0
-    for i, block in enumerate(job_counts):
-        cumulative_count += block.count
-        if cumulative_count > start:
-            return i, start - (cumulative_count - block.count)
-    # marker is start index isn't available in selected jobs
-    return -1, -1
+    redis_connection = _get_conn()
+
+    pipe = redis_connection.pipeline(transaction=False)
+    for block in blocks:
+        queue_instance = get_queue(block.queue)
+        key = _registry_redis_key(queue_instance, block.registry)
+        # each block is asked for a full page past the cursor since jobs
+        # may have moved between registries after the counting phase
+        end = cursor + length - 1
+        if block.registry == "queued":
+            pipe.lrange(key, cursor, end)
+        else:
+            pipe.zrange(key, cursor, end)
+        cursor = 0
+    id_lists = pipe.execute()
+
+    job_ids = []
+    for id_list in id_lists:
+        job_ids.extend(as_text(job_id) for job_id in id_list)
+        if len(job_ids) >= length:
+            break
+    return list(_fetch_many_jobs_fast(job_ids[:length], redis_connection))
 
 
 def resolve_jobs(job_counts, start, length, search_query=None):
@@ -588,16 +1154,19 @@ def resolve_jobs(job_counts, start, length, search_query=None):
     if start_block == -1:
         return jobs
 
+    if not search_query and length >= 0:
+        return _resolve_jobs_pipelined(job_counts[start_block:], cursor, length)
+
     for i, block in enumerate(job_counts[start_block:]):
-        # below list does not contain any None, but might give some less jobs
-        # as some might have been moved out from that registry, in such case we try to
-        # fill our length by capturing the ones from other selected registries
-        current_block_jobs = list_jobs_in_queue_registry(
-            block.queue, block.registry, search_query=search_query, start=cursor
-        )
-        jobs.extend(current_block_jobs)
+        # a search may discard arbitrarily many jobs, the whole block can
+        # be needed to fill the page; consume lazily and stop the moment
+        # the page is full instead of materializing the whole block
+        for job in list_jobs_in_queue_registry(
+            block.queue, block.registry, search_query=search_query, start=cursor, end=-1
+        ):
+            jobs.append(job)
+            if 0 <= length <= len(jobs):
+                return jobs
         cursor = 0
-        if len(jobs) >= length:
-            return jobs[:length]
 
     return jobs[:length]
@@ -34,8 +34,11 @@ setup(
     platforms="any",
     install_requires=[
         "redis>=3.3.11",
+        "hiredis>=1.0.0",
         "humanize>=2.4.0",
         "Flask>=1.1.1",
+        "Flask-Caching>=1.10.1",
+        "orjson>=3.0.0",
         "Click>=7.0",
         "six>=1.13.0",
         "Werkzeug>=0.16.0",
@@ -3,8 +3,14 @@ import os
 from tests import RQMonitorTestCase
 from tests import fixtures
 from rq.job import Job
-from rqmonitor.utils import fetch_job
+from rq.queue import Queue
+from rqmonitor.utils import (
+    bulk_worker_snapshot,
+    fetch_job,
+    job_counts_pipelined,
+)
 from rq.exceptions import NoSuchJobError
+from rqmonitor.exceptions import RQMonitorException
 
 sys.path.insert(0, os.path.join(os.getcwd(), "../"))
 
@@ -24,3 +30,38 @@ class TestUtils(RQMonitorTestCase):
         self.assertTrue(generated_jobid, fetched_job.get_id)
         with self.assertRaises(NoSuchJobError) as exc:
             none_job = fetch_job("somenonexistentid")
+
+    def test_job_counts_pipelined(self):
+        some_queue = Queue(name="some_queue")
+        for i in range(5):
+            job = Job.create(
+                func=fixtures.some_calculation, args=(3, 4), kwargs=dict(z=2)
+            )
+            some_queue.enqueue_job(job)
+
+        counts = job_counts_pipelined(
+            [("some_queue", "queued"), ("some_queue", "failed")]
+        )
+        self.assertEqual(counts, [5, 0])
+
+    def test_job_counts_pipelined_invalid_status(self):
+        with self.assertRaises(RQMonitorException) as exc:
+            job_counts_pipelined([("some_queue", "unknown")])
+        self.assertEqual(exc.exception.status_code, HTTP_BAD_REQUEST)
+
+    def test_bulk_worker_snapshot(self):
+        worker_key = "rq:worker:some_worker"
+        self.testconn.sadd("rq:workers", worker_key)
+        self.testconn.hset(worker_key, "queues", "q1,q2")
+        self.testconn.hset(worker_key, "state", "idle")
+        self.testconn.hset(worker_key, "hostname", "somehost")
+        self.testconn.hset(worker_key, "failed_job_count", 3)
+
+        snapshots = bulk_worker_snapshot()
+        self.assertEqual(len(snapshots), 1)
+        self.assertEqual(snapshots[0]["name"], "some_worker")
+        self.assertEqual(snapshots[0]["queues"], ["q1", "q2"])
+        self.assertEqual(snapshots[0]["state"], "idle")
+        self.assertEqual(snapshots[0]["hostname"], "somehost")
+        self.assertEqual(snapshots[0]["current_job_id"], None)
+        self.assertEqual(snapshots[0]["failed_job_count"], 3)